@@ -4,7 +4,7 @@
 arxiv2epub - Summary
 
 Usage:
-    arxiv2epub.py <arxiv_url> [--latex_file=<latex_file>] [--output=<output>] [--clear]
+    arxiv2epub.py <arxiv_url>... [--latex_file=<latex_file>] [--output=<output>] [--clear] [--no-cache]
     arxiv2epub.py -h|--help
     arxiv2epub.py --version
 
@@ -12,9 +12,10 @@ Options:
     -h,--help               show help.
     --version               show version.
     --output=<output>       output file name [default: out/$1.epub].
-    <arxiv_url>             arxiv url.
+    <arxiv_url>             arxiv url(s). Several papers are processed in parallel.
     --latex_file=<latex_file>  latex file name [default: main.tex].
     --clear                 clear temporary files [default: True].
+    --no-cache              force re-download and re-extraction even if cached.
 """
 
 """
@@ -32,51 +33,146 @@ import logging
 from sys import stdout
 from datetime import datetime
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(asctime)s][%(levelname)s] %(message)s",
-    stream=stdout,
-    datefmt="%m-%d %H:%M:%S",
-)
-logging.info(datetime.now())
+# don't clobber (or duplicate) handlers set up by an importing application
+if not logging.getLogger().handlers:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s][%(levelname)s] %(message)s",
+        stream=stdout,
+        datefmt="%m-%d %H:%M:%S",
+    )
 
 
 # ----------------------------- #### --------------------------
-from docopt import docopt
-import requests
+# requests and docopt are imported lazily (in the functions that need
+# them) so that --help and module imports start instantly
+import functools
 import os
+import shutil
 import subprocess
-import signal
+import tarfile
+import gzip
+from concurrent.futures import ProcessPoolExecutor
+
+# non-greedy so it stops at the first closing brace/backslash on the line
+TITLE_RE = re.compile(r"title\{(.+?)[\\\}\{]")
+
+# new-style (2503.05613v2) and old-style (math-ph/0123456) arXiv ids
+_ID_RE = re.compile(
+    r"^https?://(?:export\.)?arxiv\.org/abs/"
+    r"(\d{4}\.\d{4,5}(?:v\d+)?|[a-z\-]+/\d{7}(?:v\d+)?)/?$"
+)
+
+_SESSION = None
+
+
+def _parse_paper_id(arxiv_url: str) -> str:
+    """
+    Extracts the paper id from an arXiv abs URL.
+
+    The version suffix (vN) is kept, so it is honored when downloading;
+    use _cache_name for the on-disk cache names.
+
+    Args:
+        arxiv_url (str): The URL of the ArXiv paper.
+
+    Returns:
+        str: The paper id, including any version suffix.
+
+    Raises:
+        ValueError: If the URL is not a valid arXiv abs URL.
+    """
+    match = _ID_RE.match(arxiv_url)
+    if not match:
+        raise ValueError(
+            f"Invalid ArXiv URL: '{arxiv_url}'. Expected "
+            "'https://arxiv.org/abs/<paper_id>' or "
+            "'https://export.arxiv.org/abs/<paper_id>'."
+        )
+    return match.group(1)
+
+
+def _cache_name(paper_id: str) -> str:
+    """
+    Normalizes a paper id for use in on-disk cache names.
+
+    The version suffix (vN) is stripped so versions of the same paper
+    share a cache slot, and the slash in old-style ids is flattened.
+    """
+    return re.sub(r"v\d+$", "", paper_id).replace("/", "_")
+
+
+def _get_session():
+    """
+    Returns a shared requests.Session, creating it on first use.
+
+    Keep-alive reuses the TCP+TLS connection across papers, and the retry
+    policy backs off on arXiv's 429/503 rate-limit responses.
+    """
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        session = requests.Session()
+        session.headers.update(
+            {"Accept-Encoding": "gzip", "User-Agent": "arxiv2epub/1.0"}
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5, backoff_factor=1.5, status_forcelist=[429, 503]
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _SESSION = session
+    return _SESSION
 
 
 # ####################################################################
-def download_latex_from_arxiv(arxiv_url, output_dir="downloads"):
+def download_latex_from_arxiv(arxiv_url, output_dir="downloads", use_cache=True):
     """
     Downloads the LaTeX source code for a given ArXiv URL.
 
     Args:
         arxiv_url (str): The URL of the ArXiv paper.
         output_dir (str): Directory to save the downloaded LaTeX files.
+        use_cache (bool): Reuse a previously downloaded archive if present.
 
     Returns:
         str: Path to the downloaded LaTeX file.
     """
-    if not arxiv_url.startswith("https://arxiv.org/abs/"):
-        raise ValueError("Invalid ArXiv URL. Must start with 'https://arxiv.org/abs/'.")
-
-    paper_id = arxiv_url.split("/")[-1]
-    source_url = f"https://arxiv.org/e-print/{paper_id}"
+    paper_id = _parse_paper_id(arxiv_url)
+    # export mirror: no 301 redirect and friendlier to automated traffic
+    source_url = f"https://export.arxiv.org/e-print/{paper_id}"
 
     os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, f"{paper_id}.tar.gz")
+    output_path = os.path.join(output_dir, f"{_cache_name(paper_id)}.tar.gz")
+
+    if use_cache and os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+        logging.info(f"Using cached download: {output_path}")
+        return output_path
 
     logging.info(f"Starting download for ArXiv URL: {arxiv_url}")
-    response = requests.get(source_url, stream=True)
+    # (connect, read) timeouts so a dead connection cannot hang the run
+    response = _get_session().get(source_url, stream=True, timeout=(5, 60))
 
     if response.status_code == 200:
-        with open(output_path, "wb") as file:
-            for chunk in response.iter_content(chunk_size=1024):
-                file.write(chunk)
+        response.raw.decode_content = True
+        # write to a temp name and rename at the end, so an interrupted
+        # download never leaves a partial archive in the cache
+        tmp_path = output_path + ".part"
+        try:
+            with open(tmp_path, "wb") as file:
+                _preallocate(file, int(response.headers.get("Content-Length", 0)))
+                shutil.copyfileobj(response.raw, file, length=1024 * 1024)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         logging.info(f"Download completed. File saved at: {output_path}")
         return output_path
     else:
@@ -90,49 +186,226 @@ def download_latex_from_arxiv(arxiv_url, output_dir="downloads"):
 
 # ####################################################################
 def get_title(latex_file: str) -> str:
+    # memoized on (path, mtime) so warm re-runs skip the file entirely
+    return _get_title_cached(latex_file, os.path.getmtime(latex_file))
+
+
+@functools.lru_cache(maxsize=128)
+def _get_title_cached(latex_file: str, mtime: float) -> str:
     logging.info(f"Extracting title from LaTeX file: {latex_file}")
-    rg = r"title\{(.+)[\\\}\{]"
+    # \title{...} lives in the preamble, so stream lines and stop at the
+    # first match instead of reading the whole file into memory
     with open(latex_file, 'r', encoding='utf-8') as file:
-        content = file.read()
-    
-    match = re.search(rg, content)
-    logging.debug(match)
-    if match:
-        logging.info(f"Title found: {match.group(1).strip()}")
-        return match.group(1).strip()
-    else:
-        logging.warning("No title found in the LaTeX file.")
-        return latex_file
+        for line in file:
+            match = TITLE_RE.search(line)
+            if match:
+                logging.info(f"Title found: {match.group(1).strip()}")
+                return match.group(1).strip()
+
+    logging.warning("No title found in the LaTeX file.")
+    return latex_file
 
 
 # ####################################################################
-def unzip_latex_file(file_path, output_dir="unzipped"):
+def unzip_latex_file(file_path, output_dir="unzipped", use_cache=True):
     """
     Unzips a .tar.gz file into a folder named after the paper ID.
 
     Args:
         file_path (str): Path to the .tar.gz file.
         output_dir (str): Base directory to extract the contents.
+        use_cache (bool): Reuse a previously extracted directory if present.
 
     Returns:
         str: Path to the directory containing the extracted files.
     """
     paper_id = os.path.basename(file_path).replace(".tar.gz", "")
     paper_dir = os.path.join(output_dir, paper_id)
-    os.makedirs(paper_dir, exist_ok=True)
+    if use_cache and os.path.isdir(paper_dir) and os.listdir(paper_dir):
+        logging.info(f"Using cached extraction: {paper_dir}")
+        return paper_dir
     logging.info(f"Preparing to unzip file: {file_path}")
 
+    with open(file_path, "rb") as file:
+        magic = file.read(2)
+    if magic != b"\x1f\x8b":
+        raise Exception(f"Not a gzip file: {file_path}")
+
+    # extract into a temp dir and rename into place on success, so a
+    # failed extraction never leaves a partial dir for the cache to hit
+    tmp_dir = paper_dir + ".part"
     try:
-        subprocess.run(
-            ["tar", "-xzf", file_path, "-C", paper_dir],
-            check=True,
-        )
-        logging.info(f"Extraction completed. Files are in: {paper_dir}")
+        os.makedirs(tmp_dir, exist_ok=True)
+        try:
+            # open() parses the first member header, so a ReadError here means
+            # the file is not a tarball; errors mid-extraction propagate
+            tar = tarfile.open(file_path, "r:gz")
+        except tarfile.ReadError:
+            # some e-prints are a bare gzip of a single .tex file, not a tarball
+            logging.info(f"Not a tarball, treating as gzipped .tex: {file_path}")
+            with gzip.open(file_path, "rb") as src:
+                with open(os.path.join(tmp_dir, "main.tex"), "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+        else:
+            with tar:
+                tar.extractall(tmp_dir, filter=_keep_relevant)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    if os.path.isdir(paper_dir):
+        shutil.rmtree(paper_dir)  # stale or empty entry from an earlier run
+    os.replace(tmp_dir, paper_dir)
+    logging.info(f"Extraction completed. Files are in: {paper_dir}")
+    return paper_dir
+
+
+# the only file types latexml actually reads; skipping the rest (.log,
+# .aux, .synctex.gz, editor backups, ...) saves disk I/O and inodes
+KEEP_EXTENSIONS = (
+    ".tex", ".bbl", ".sty", ".cls", ".bib",
+    ".jpg", ".jpeg", ".png", ".gif", ".pdf", ".eps", ".ps",
+)
+
+
+def _keep_relevant(member, path):
+    """tarfile extraction filter: keep directories and relevant files only."""
+    if member.isdir() or member.name.lower().endswith(KEEP_EXTENSIONS):
+        return tarfile.data_filter(member, path)
+    return None
+
+
+def _preallocate(file, size: int) -> None:
+    """
+    Tells the filesystem the final file size up front, when supported.
+
+    Contiguous extents reduce fragmentation for multi-MB archives; on
+    filesystems without fallocate (e.g. tmpfs) this is a silent no-op.
+    """
+    if size > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(file.fileno(), 0, size)
+        except OSError:
+            pass
+
+
+class _TeeReader:
+    """File-like reader that copies everything it reads into a sink file."""
+
+    def __init__(self, source, sink):
+        self.source = source
+        self.sink = sink
+
+    def read(self, size=-1):
+        data = self.source.read(size)
+        self.sink.write(data)
+        return data
+
+
+def download_and_extract(arxiv_url, download_dir="downloads", output_dir="unzipped", use_cache=True):
+    """
+    Downloads and extracts the arXiv source in a single streaming pass.
+
+    The tar.gz is untarred directly from the HTTP response, so the bytes
+    never make a round trip through the disk before extraction. A copy of
+    the archive is still teed into the download dir to keep the cache warm.
+
+    Args:
+        arxiv_url (str): The URL of the ArXiv paper.
+        download_dir (str): Directory where the archive copy is cached.
+        output_dir (str): Base directory to extract the contents.
+        use_cache (bool): Reuse cached downloads/extractions if present.
+
+    Returns:
+        str: Path to the directory containing the extracted files.
+    """
+    paper_id = _parse_paper_id(arxiv_url)
+    paper_dir = os.path.join(output_dir, _cache_name(paper_id))
+    if use_cache and os.path.isdir(paper_dir) and os.listdir(paper_dir):
+        logging.info(f"Using cached extraction: {paper_dir}")
         return paper_dir
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Failed to unzip file: {e}")
-        raise Exception(f"Error unzipping file: {file_path}")
 
+    archive_path = os.path.join(download_dir, f"{_cache_name(paper_id)}.tar.gz")
+    if use_cache and os.path.exists(archive_path) and os.path.getsize(archive_path) > 0:
+        return unzip_latex_file(archive_path, output_dir, use_cache=use_cache)
+
+    source_url = f"https://export.arxiv.org/e-print/{paper_id}"
+    os.makedirs(download_dir, exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
+
+    logging.info(f"Streaming download+extract for ArXiv URL: {arxiv_url}")
+    with _get_session().get(source_url, stream=True, timeout=(5, 60)) as response:
+        if response.status_code != 200:
+            logging.error(
+                f"Failed to download LaTeX source. HTTP Status: {response.status_code}"
+            )
+            raise Exception(f"Failed to download LaTeX source from {source_url}")
+        response.raw.decode_content = False  # keep the gzip bytes for the cache copy
+        # tee the archive into a temp name and extract into a temp dir,
+        # renaming both at the end, so an interrupted run never leaves a
+        # partial entry that the cache checks would treat as a hit
+        tmp_path = archive_path + ".part"
+        tmp_dir = paper_dir + ".part"
+        is_tarball = True
+        try:
+            with open(tmp_path, "wb") as cache_file:
+                _preallocate(cache_file, int(response.headers.get("Content-Length", 0)))
+                try:
+                    # "r|gz" reads the stream sequentially, so tarfile never
+                    # seeks; open() parses the first member header, so a
+                    # ReadError *here* means the payload is not a tarball at
+                    # all, while errors mid-extraction (truncated/corrupt
+                    # stream) propagate and discard the .part artifacts
+                    tar = tarfile.open(fileobj=_TeeReader(response.raw, cache_file), mode="r|gz")
+                except tarfile.ReadError:
+                    # bare gzipped .tex payload: finish the download, then let
+                    # unzip_latex_file dispatch on the archive from disk
+                    shutil.copyfileobj(response.raw, cache_file, 1024 * 1024)
+                    is_tarball = False
+                else:
+                    with tar:
+                        os.makedirs(tmp_dir, exist_ok=True)
+                        tar.extractall(tmp_dir, filter=_keep_relevant)
+            os.replace(tmp_path, archive_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+    if not is_tarball:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return unzip_latex_file(archive_path, output_dir, use_cache=False)
+    if os.path.isdir(paper_dir):
+        shutil.rmtree(paper_dir)  # stale or empty entry from an earlier run
+    os.replace(tmp_dir, paper_dir)
+    logging.info(f"Extraction completed. Files are in: {paper_dir}")
+    return paper_dir
+
+
+
+def _run_streaming(command: list) -> None:
+    """
+    Runs a command, streaming its combined stdout/stderr to the log.
+
+    Args:
+        command (list): The command and its arguments.
+
+    Raises:
+        RuntimeError: If the command exits with a non-zero status.
+    """
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,  # line-buffered so progress shows up as it happens
+    )
+    for line in process.stdout:
+        logging.debug(line.rstrip())
+    return_code = process.wait()
+    if return_code:
+        raise RuntimeError(
+            f"Command '{command[0]}' failed with exit code {return_code}"
+        )
 
 
 def run_latexml(latex_file: str, output_file: str = "out/main.xml") -> None:
@@ -148,11 +421,13 @@ def run_latexml(latex_file: str, output_file: str = "out/main.xml") -> None:
     """
     logging.info(f"Running latexml on file: {latex_file}, output: {output_file}")
     try:
-        command = ["latexml", f"--dest={output_file}", latex_file,"--verbose", "--includestyles", "--nocomments"]
-        result = subprocess.run(command, check=True)
-        logging.info(f"latexml command executed successfully: {result.stdout}")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Error running latexml: {e.stderr}")
+        # latexmlc with --expire keeps a latexmls worker alive between
+        # invocations, amortizing the ~2s Perl/module startup cost.
+        command = ["latexmlc", "--expire=60", f"--dest={output_file}", latex_file, "--includestyles", "--nocomments"]
+        _run_streaming(command)
+        logging.info("latexml command executed successfully.")
+    except RuntimeError as e:
+        logging.error(f"Error running latexml: {e}")
         raise RuntimeError("Failed to run latexml command") from e
     
 
@@ -170,10 +445,10 @@ def run_latexmlpost(xml_file: str = "out/main.xml", output_file: str = "out/main
     logging.info(f"Running latexmlpost on file: {xml_file}, output: {output_file}")
     try:
         command = ["latexmlpost", f"--dest={output_file}", xml_file, "-navigationtoc=context"] #, "--split",  "-mathsvg","-navigationtoc=context"
-        result = subprocess.run(command, check=True)
-        logging.info(f"latexmlpost command executed successfully: {result.stdout}")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Error running latexmlpost: {e.stderr}")
+        _run_streaming(command)
+        logging.info("latexmlpost command executed successfully.")
+    except RuntimeError as e:
+        logging.error(f"Error running latexmlpost: {e}")
         raise RuntimeError("Failed to run latexmlpost command") from e
     
 def convert_html_to_epub(epub_file: str, html_file: str = "out/main.html") -> None:
@@ -198,10 +473,10 @@ def convert_html_to_epub(epub_file: str, html_file: str = "out/main.html") -> No
             #"--output-profile=kobo",
             "--epub-toc-at-end"
         ]
-        result = subprocess.run(command, check=True)
-        logging.info(f"ebook-convert command executed successfully: {result.stdout}")
-    except subprocess.CalledProcessError as e:
-        logging.error(f"Error running ebook-convert: {e.stderr}")
+        _run_streaming(command)
+        logging.info("ebook-convert command executed successfully.")
+    except RuntimeError as e:
+        logging.error(f"Error running ebook-convert: {e}")
         raise RuntimeError("Failed to convert HTML to EPUB") from e
     
 
@@ -218,50 +493,40 @@ def list_tex_files(folder: str) -> list:
     if not os.path.isdir(folder):
         raise ValueError(f"The folder '{folder}' does not exist or is not a directory.")
 
-    tex_files = [f for f in os.listdir(folder) if f.endswith(".tex")]
+    with os.scandir(folder) as entries:
+        tex_files = [
+            e.name
+            for e in entries
+            if e.is_file(follow_symlinks=False) and e.name.endswith(".tex")
+        ]
     logging.info(f"Found {len(tex_files)} .tex files in folder '{folder}'.")
     logging.info(f"List of .tex files: {tex_files}")
     return tex_files
 
 
-def ensure_latex_element_exists(tex_files: list, element: str) -> str:
+def ensure_latex_element_exists(tex_files: list, folder: str, element: str = r"\begin{document}") -> str:
     """
-    Ensures that the specified LaTeX element exists in one of the .tex files.
-    If not found, prompts the user to select a file from the list.
+    Finds the first .tex file whose content contains the given LaTeX element.
+
+    Only the first 64 KiB of each file is read, since elements like
+    \\documentclass or \\begin{document} are always near the top.
 
     Args:
-        tex_files (list): List of .tex file paths.
+        tex_files (list): List of .tex file names inside folder.
+        folder (str): Directory containing the .tex files.
         element (str): The LaTeX element to search for (e.g., "\\begin{document}").
 
     Returns:
-        str: Path to the selected .tex file.
+        str: Name of the first .tex file containing the element.
     """
-    logging.info(f"Ensuring LaTeX element '{element}' exists in the provided .tex files.")
-    if element in tex_files:
-        logging.info(f"Found LaTeX element '{element}' in file '{tex_files}'.")
-        return element
-    else:
-        print("LaTeX element not found in any file.")
-        print("Available .tex files:")
-        for i, file in enumerate(tex_files):
-            print(f"{i}: {file}")
-        def timeout_handler(signum, frame):
-            raise TimeoutError("User input timed out.")
-
-        signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(20)  # Set timeout to 20 seconds
-
-        try:
-            selected_index = int(input("Select a file by index: "))
-        except TimeoutError:
-            logging.warning("User input timed out. Returning the first file by default.")
-            selected_index = 0
-        finally:
-            signal.alarm(0)  # Disable the alarm
-        if selected_index < 0 or selected_index >= len(tex_files):
-            raise ValueError("Invalid index selected.")
-        logging.info(f"Selected LaTeX file: {tex_files[selected_index]}")
-        return tex_files[selected_index]
+    logging.info(f"Searching for LaTeX element '{element}' in the provided .tex files.")
+    for file_name in tex_files:
+        file_path = os.path.join(folder, file_name)
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+            if element in file.read(65536):
+                logging.info(f"Found LaTeX element '{element}' in file '{file_name}'.")
+                return file_name
+    raise ValueError(f"No .tex file containing '{element}' found in '{folder}'.")
 
 def delete_non_epub_files(output_dir: str = "out") -> None:
     """
@@ -275,47 +540,102 @@ def delete_non_epub_files(output_dir: str = "out") -> None:
         return
 
     logging.info(f"Cleaning up non-EPUB files in directory: {output_dir}")
-    for file_name in os.listdir(output_dir):
-        file_path = os.path.join(output_dir, file_name)
-        if not file_name.endswith(".epub") and os.path.isfile(file_path):
-            try:
-                os.remove(file_path)
-                logging.info(f"Deleted file: {file_path}")
-            except Exception as e:
-                logging.error(f"Failed to delete file '{file_path}': {e}")
+    deleted = 0
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".epub") and entry.is_file():
+                try:
+                    os.remove(entry.path)
+                    deleted += 1
+                    logging.debug(f"Deleted file: {entry.path}")
+                except Exception as e:
+                    logging.error(f"Failed to delete file '{entry.path}': {e}")
+    logging.info(f"Deleted {deleted} non-EPUB files from '{output_dir}'.")
+
+def process_paper(arxiv_url: str, latex_file_name: str, output_file: str, use_cache: bool = True) -> str:
+    """
+    Runs the full download -> extract -> convert pipeline for one paper.
 
-def main(args):
-    logging.info("Starting main process with arguments:")
-    logging.info(args)
-    arxiv_url = args["<arxiv_url>"]
-    latex_file_name = args["--latex_file"]
-    output_file = args["--output"]
-    clear_temp_files = args["--clear"]
+    Args:
+        arxiv_url (str): The URL of the ArXiv paper.
+        latex_file_name (str): Name of the main LaTeX file.
+        output_file (str): Output EPUB path ($1 is replaced by the title).
+        use_cache (bool): Reuse cached downloads/extractions.
 
-    latex_file = download_latex_from_arxiv(arxiv_url)
-    extracted_dir = unzip_latex_file(latex_file)
+    Returns:
+        str: Path to the generated EPUB file.
+    """
+    extracted_dir = download_and_extract(arxiv_url, use_cache=use_cache)
     logging.info(f"Extracted directory: {extracted_dir}")
 
     latex_found = list_tex_files(extracted_dir)
-    latex_file_name = ensure_latex_element_exists(latex_found, latex_file_name)
+    if latex_file_name not in latex_found:
+        latex_file_name = ensure_latex_element_exists(latex_found, extracted_dir)
 
     latex_full_file = os.path.join(extracted_dir, latex_file_name)
     title = get_title(latex_full_file)
 
     if "$1" in output_file:
         output_file = output_file.replace("$1", title)
-    
-    run_latexml(latex_full_file)
-    run_latexmlpost()
-    convert_html_to_epub(output_file)
 
-    if clear_temp_files:
-        delete_non_epub_files("out")
+    # per-paper intermediate files so parallel runs do not clobber each other
+    paper_id = os.path.basename(extracted_dir)
+    xml_file = os.path.join("out", f"{paper_id}.xml")
+    html_file = os.path.join("out", f"{paper_id}.html")
+
+    run_latexml(latex_full_file, output_file=xml_file)
+    run_latexmlpost(xml_file, html_file)
+    convert_html_to_epub(output_file, html_file)
 
     logging.info(f"Final EPUB file created: {output_file}")
+    return output_file
+
+
+def main(args):
+    logging.info("Starting main process with arguments:")
+    logging.info(args)
+    arxiv_urls = args["<arxiv_url>"]
+    latex_file_name = args["--latex_file"]
+    output_file = args["--output"]
+    clear_temp_files = args["--clear"]
+    use_cache = not args["--no-cache"]
+
+    if len(arxiv_urls) == 1:
+        process_paper(arxiv_urls[0], latex_file_name, output_file, use_cache)
+    else:
+        if "$1" in output_file:
+            output_files = [output_file] * len(arxiv_urls)
+        else:
+            # a fixed --output would make every worker write the same epub;
+            # suffix the paper id so the results don't clobber each other
+            logging.warning(
+                f"--output '{output_file}' has no $1 placeholder; appending "
+                "the paper id to keep one epub per paper."
+            )
+            root, ext = os.path.splitext(output_file)
+            output_files = [
+                f"{root}_{_cache_name(_parse_paper_id(url))}{ext}"
+                for url in arxiv_urls
+            ]
+
+        # each paper is an independent subprocess-heavy pipeline, so they
+        # parallelize cleanly across cores
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                executor.submit(process_paper, url, latex_file_name, out, use_cache)
+                for url, out in zip(arxiv_urls, output_files)
+            ]
+            for future in futures:
+                future.result()
+
+    if clear_temp_files:
+        delete_non_epub_files("out")
 
 
 if __name__ == "__main__":
+    from docopt import docopt
+
+    logging.info(datetime.now())
     logging.info("Program started.")
     args = docopt(
         doc=__doc__,